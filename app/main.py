@@ -10,6 +10,7 @@ from .services.food_prediction_service import FoodPredictionService
 from .services.data_service import DataService
 from .services.city_model_service import CityModelService
 from .services.daily_report_service import DailyReportService
+from .services.report_rollup_service import ReportRollupService
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -32,7 +33,8 @@ try:
     data_service = DataService()
     # Initialize new services
     city_model_service = CityModelService()
-    daily_report_service = DailyReportService(city_model_service)
+    report_rollup_service = ReportRollupService()
+    daily_report_service = DailyReportService(city_model_service, report_rollup_service)
     logger.info("Services initialized successfully")
 except Exception as e:
     logger.error(f"Failed to initialize services: {str(e)}")
@@ -149,6 +151,40 @@ async def process_daily_report(request: DailyReportRequest):
         logger.error(f"Error processing daily report: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
+class RollupResponse(BaseModel):
+    rollups: List[dict]
+
+@app.get("/rollups/{granularity}", response_model=RollupResponse)
+async def get_rollups(granularity: str, city_name: Optional[str] = None, bucket: Optional[str] = None):
+    try:
+        rollups = report_rollup_service.get_rollups(
+            granularity=granularity,
+            city_name=city_name,
+            bucket=bucket
+        )
+        return {"rollups": rollups}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error fetching rollups: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/rollups/{granularity}/top", response_model=RollupResponse)
+async def get_top_rollups(granularity: str, metric: str = "aliens_sum", bucket: Optional[str] = None, k: int = 10):
+    try:
+        rollups = report_rollup_service.top_cities(
+            granularity=granularity,
+            metric=metric,
+            bucket=bucket,
+            k=k
+        )
+        return {"rollups": rollups}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error fetching top rollups: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.get("/health")
 async def health_check():
     return {"status": "healthy"}
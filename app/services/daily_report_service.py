@@ -6,8 +6,9 @@ import os
 logger = logging.getLogger(__name__)
 
 class DailyReportService:
-    def __init__(self, city_model_service):
+    def __init__(self, city_model_service, rollup_service=None):
         self.city_model_service = city_model_service
+        self.rollup_service = rollup_service
         self.openai_api_key = os.getenv("OPENAI_API_KEY")
         if not self.openai_api_key:
             raise ValueError("OPENAI_API_KEY environment variable is not set")
@@ -20,9 +21,17 @@ class DailyReportService:
           - Generate a report document with pointers.
           - Provide auto-fill suggestions for other prediction pages.
           - Use OpenAI to generate infrastructure advice.
+          - Fold the report into the daily/weekly/monthly rollups.
         """
         try:
+            previous_growth_rate = self.city_model_service.get_city_model()["base_growth_rate"]
             updated_model, pointers = self.city_model_service.update_model_with_daily_report(aliens_count, comments)
+            if self.rollup_service:
+                self.rollup_service.record_report(
+                    city_name=updated_model["city_name"],
+                    aliens_count=aliens_count,
+                    growth_rate_delta=updated_model["base_growth_rate"] - previous_growth_rate
+                )
             auto_fill = {
                 "housing": {
                     "current_price": updated_model["base_price"],
@@ -0,0 +1,91 @@
+# services/report_rollup_service.py
+import heapq
+import logging
+from datetime import date
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+GRANULARITIES = ("daily", "weekly", "monthly")
+METRICS = ("count", "aliens_sum", "aliens_max", "growth_rate_delta")
+GLOBAL_KEY = "__global__"
+
+
+class ReportRollupService:
+    def __init__(self):
+        # rollups[granularity][bucket][city] -> aggregate dict.
+        # Aggregates are updated in place as reports arrive so reads never replay history.
+        self.rollups = {granularity: {} for granularity in GRANULARITIES}
+
+    @staticmethod
+    def bucket_key(granularity: str, day: date) -> str:
+        """Return the bucket label for a day: YYYY-MM-DD, ISO YYYY-Www or YYYY-MM."""
+        if granularity == "daily":
+            return day.isoformat()
+        if granularity == "weekly":
+            year, week, _ = day.isocalendar()
+            return f"{year}-W{week:02d}"
+        if granularity == "monthly":
+            return f"{day.year}-{day.month:02d}"
+        raise ValueError(f"Unknown granularity: {granularity}")
+
+    def record_report(self, city_name: str, aliens_count: int, growth_rate_delta: float,
+                      day: Optional[date] = None):
+        """Fold a single daily report into every bucket it belongs to, per city and globally."""
+        day = day or date.today()
+        for granularity in GRANULARITIES:
+            bucket = self.rollups[granularity].setdefault(self.bucket_key(granularity, day), {})
+            for key in (city_name, GLOBAL_KEY):
+                stats = bucket.get(key)
+                if stats is None:
+                    bucket[key] = {
+                        "count": 1,
+                        "aliens_sum": aliens_count,
+                        "aliens_max": aliens_count,
+                        "growth_rate_delta": growth_rate_delta,
+                    }
+                else:
+                    stats["count"] += 1
+                    stats["aliens_sum"] += aliens_count
+                    stats["aliens_max"] = max(stats["aliens_max"], aliens_count)
+                    stats["growth_rate_delta"] += growth_rate_delta
+        logger.info(f"Recorded report rollup for {city_name}: {aliens_count} aliens on {day}")
+
+    def get_rollups(self, granularity: str, city_name: Optional[str] = None,
+                    bucket: Optional[str] = None) -> List[Dict]:
+        """Return aggregates for a granularity, optionally filtered to one city and/or bucket.
+           Omitting city_name returns the global aggregates."""
+        buckets = self._buckets(granularity)
+        key = city_name or GLOBAL_KEY
+        labels = [bucket] if bucket else sorted(buckets)
+        results = []
+        for label in labels:
+            stats = buckets.get(label, {}).get(key)
+            if stats is not None:
+                results.append({"bucket": label, "city_name": city_name, **stats})
+        return results
+
+    def top_cities(self, granularity: str, metric: str, bucket: Optional[str] = None,
+                   k: int = 10) -> List[Dict]:
+        """Return the k cities with the highest metric in a bucket (latest bucket by default)."""
+        if metric not in METRICS:
+            raise ValueError(f"Unknown metric: {metric}")
+        if k < 1:
+            raise ValueError("k must be at least 1")
+        buckets = self._buckets(granularity)
+        if bucket is None:
+            if not buckets:
+                return []
+            bucket = max(buckets)
+        cities = buckets.get(bucket, {})
+        top = heapq.nlargest(
+            k,
+            ((city, stats) for city, stats in cities.items() if city != GLOBAL_KEY),
+            key=lambda item: item[1][metric]
+        )
+        return [{"bucket": bucket, "city_name": city, **stats} for city, stats in top]
+
+    def _buckets(self, granularity: str) -> Dict:
+        if granularity not in self.rollups:
+            raise ValueError(f"Unknown granularity: {granularity}")
+        return self.rollups[granularity]